@@ -1,14 +1,20 @@
 """The DD-WRT integration."""
 from __future__ import annotations
 
+import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_CLOSE,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant
 
 from .const import (
     CONF_ROUTER_IP,
     CONF_ROUTER_PORT,
+    CONF_TRACKER_INTERFACES,
     CONF_USE_SSL,
     DOMAIN,
     LOGGER,
@@ -26,7 +32,27 @@ PLATFORMS: list[Platform] = [
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up DD-WRT from a config entry."""
-    session = async_get_clientsession(hass, verify_ssl=False)
+    # Dedicated keep-alive pool so every poll reuses the router connections.
+    # Certificates are not verified; DD-WRT ships self-signed ones.
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=8,
+            limit_per_host=4,
+            keepalive_timeout=120,
+            ssl=False,
+        ),
+        timeout=aiohttp.ClientTimeout(total=10),
+    )
+    # Close the pool on unload, on a failed setup and when HA stops, which
+    # does not unload config entries
+    entry.async_on_unload(session.close)
+
+    async def _async_close_session(_event: Event) -> None:
+        await session.close()
+
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
+    )
 
     coordinator = DDWRTDataUpdateCoordinator(
         hass,
@@ -36,6 +62,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
         use_ssl=entry.data[CONF_USE_SSL],
+        tracker_interfaces=entry.data.get(CONF_TRACKER_INTERFACES, []),
     )
 
     await coordinator.async_config_entry_first_refresh()
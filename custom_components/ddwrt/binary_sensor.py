@@ -8,15 +8,16 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import DDWRTDataUpdateCoordinator
+from .coordinator import DDWRTDataUpdateCoordinator, device_info_for
 
-BINARY_SENSOR_TYPES: dict[str, BinarySensorEntityDescription] = {
-    "wan_status": BinarySensorEntityDescription(
+BINARY_SENSOR_TYPES: tuple[BinarySensorEntityDescription, ...] = (
+    BinarySensorEntityDescription(
         key="wan_status",
         name="Internet Connection",
         translation_key="wan_status",
@@ -24,7 +25,7 @@ BINARY_SENSOR_TYPES: dict[str, BinarySensorEntityDescription] = {
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
-    "wl_radio": BinarySensorEntityDescription(
+    BinarySensorEntityDescription(
         key="wl_radio",
         name="Wi-Fi Radio",
         translation_key="wl_radio",
@@ -32,6 +33,26 @@ BINARY_SENSOR_TYPES: dict[str, BinarySensorEntityDescription] = {
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
+)
+
+
+def _wan_connected(val: str) -> bool:
+    """Return true if the WAN status string reports a connection."""
+    s = val.strip()
+    # Only the prefix matters, so avoid lowercasing the whole status line
+    return len(s) >= 9 and s[:9].lower() == "connected"
+
+
+def _radio_active(val: str) -> bool:
+    """Return true if the radio status string reports active."""
+    s = val.strip()
+    return len(s) == 6 and s.lower() == "active"
+
+
+# Per-key state predicates, looked up once per state read
+_PREDICATES = {
+    "wan_status": _wan_connected,
+    "wl_radio": _radio_active,
 }
 
 
@@ -43,12 +64,13 @@ async def async_setup_entry(
     """Set up DD-WRT binary sensors."""
     coordinator: DDWRTDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     device_name = f"ddwrt-{entry.data['name']}"
+    device_info = device_info_for(device_name)
 
     entities = []
 
-    for key, desc in BINARY_SENSOR_TYPES.items():
-        entity = DDWRTBinarySensor(coordinator, device_name, desc)
-        if key not in coordinator.data:
+    for desc in BINARY_SENSOR_TYPES:
+        entity = DDWRTBinarySensor(coordinator, device_name, device_info, desc)
+        if desc.key not in coordinator.data:
              entity._attr_entity_registry_enabled_default = False
         entities.append(entity)
 
@@ -62,6 +84,7 @@ class DDWRTBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self,
         coordinator: DDWRTDataUpdateCoordinator,
         device_name: str,
+        device_info: DeviceInfo,
         description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize."""
@@ -71,24 +94,13 @@ class DDWRTBinarySensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_unique_id = f"{device_name}_{description.key}"
         self._attr_has_entity_name = True
         self._attr_entity_registry_enabled_default = True
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_name)},
-            "name": device_name.replace("ddwrt-", "").replace("-", " ").title(),
-            "manufacturer": "DD-WRT",
-            "model": "Router",
-        }
+        self._attr_device_info = device_info
+        # Resolve the state predicate once instead of on every state read
+        self._key = description.key
+        self._pred = _PREDICATES.get(description.key, bool)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        val = self.coordinator.data.get(self.entity_description.key)
-        if val is None:
-            return None
-
-        if self.entity_description.key == "wan_status":
-            return val.strip().lower().startswith("connected")
-
-        if self.entity_description.key == "wl_radio":
-            return val.strip().lower() == "active"
-
-        return bool(val)
\ No newline at end of file
+        val = self.coordinator.data.get(self._key)
+        return None if val is None else self._pred(val)
\ No newline at end of file
@@ -1,16 +1,16 @@
 """Button platform for DD-WRT."""
 from __future__ import annotations
 
-import aiohttp
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, LOGGER
-from .coordinator import DDWRTDataUpdateCoordinator
+from .coordinator import DDWRTDataUpdateCoordinator, device_info_for
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -20,11 +20,13 @@ async def async_setup_entry(
     """Set up DD-WRT buttons."""
     coordinator: DDWRTDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     device_name = f"ddwrt-{entry.data['name']}"
+    device_info = device_info_for(device_name)
     
     entities = [
         DDWRTButton(
             coordinator,
             device_name,
+            device_info,
             ButtonEntityDescription(
                 key="reboot",
                 name="Reboot Router",
@@ -45,6 +47,7 @@ class DDWRTButton(CoordinatorEntity, ButtonEntity):
         self,
         coordinator: DDWRTDataUpdateCoordinator,
         device_name: str,
+        device_info: DeviceInfo,
         description: ButtonEntityDescription,
     ) -> None:
         """Initialize the button."""
@@ -53,12 +56,7 @@ class DDWRTButton(CoordinatorEntity, ButtonEntity):
         self._device_name = device_name
         self._attr_unique_id = f"{device_name}_{description.key}"
         self._attr_has_entity_name = True
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_name)},
-            "name": device_name.replace("ddwrt-", "").replace("-", " ").title(),
-            "manufacturer": "DD-WRT",
-            "model": "Router",
-        }
+        self._attr_device_info = device_info
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -69,11 +67,10 @@ class DDWRTButton(CoordinatorEntity, ButtonEntity):
         """Send reboot command to router."""
         url = f"{self.coordinator.base_url}/apply.cgi"
         data = {"action": "Reboot"}
-        auth = aiohttp.BasicAuth(self.coordinator.username, self.coordinator.password)
-        
+
         try:
             LOGGER.info("Sending reboot command to DD-WRT router")
-            async with self.coordinator.session.post(url, data=data, auth=auth) as response:
+            async with self.coordinator.session.post(url, data=data, auth=self.coordinator.auth) as response:
                 if response.status != 200:
                     LOGGER.error("Reboot failed with status: %s", response.status)
         except Exception as err:
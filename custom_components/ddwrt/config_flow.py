@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import asyncio
+import ipaddress
+import re
 from typing import Any
 
 import aiohttp
@@ -19,9 +21,42 @@ from .const import (
     CONF_TRACKER_INTERFACES,
     CONF_USE_SSL,
     DOMAIN,
+    HTTP_PORTS,
+    HTTPS_PORTS,
     LOGGER,
 )
-from .coordinator import DDWRTDataUpdateCoordinator
+from .coordinator import DDWRTDataUpdateCoordinator, build_base_url
+
+# Markers that identify a DD-WRT status payload
+_DDWRT_SIG = re.compile(rb"\{(?:uptime|ipinfo)::")
+# Stop reading the credential-check page after this many bytes
+_SIG_SCAN_LIMIT = 16 * 1024
+# Bytes of the previous chunk to rescan so a marker split across chunks
+# is still found (longest marker is 9 bytes, e.g. b"{uptime::")
+_SIG_OVERLAP = len(b"{uptime::") - 1
+
+# Statuses a reachable DD-WRT httpd answers the unauthenticated probe with
+_PROBE_OK_STATUSES = (200, 401, 403, 301, 302)
+
+# RFC 1123 hostname: dot-separated labels of letters, digits and inner hyphens
+_HOSTNAME_RE = re.compile(
+    r"(?!-)[A-Za-z0-9-]{1,63}(?<!-)(?:\.(?!-)[A-Za-z0-9-]{1,63}(?<!-))*\.?"
+)
+
+
+def _is_ip_address(host: str) -> bool:
+    """Return true if host is a literal IPv4 or IPv6 address."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_valid_host(host: str) -> bool:
+    """Return true if host is an IP address or a well-formed hostname."""
+    return _is_ip_address(host) or _HOSTNAME_RE.fullmatch(host) is not None
+
 
 STEP_CONN_DATA_SCHEMA = vol.Schema(
     {
@@ -46,6 +81,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize."""
         self._temp_config: dict[str, Any] = {}
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the session shared by every step of this flow."""
+        # hass is attached after __init__, so resolve the session lazily
+        if self._session is None:
+            self._session = async_get_clientsession(self.hass, verify_ssl=False)
+        return self._session
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -57,43 +100,90 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ip = user_input[CONF_ROUTER_IP]
             port = user_input.get(CONF_ROUTER_PORT)
 
-            # Determine protocol and port if not specified
-            ports_to_try = []
-            if port:
-                ports_to_try.append((port, False))
-                ports_to_try.append((port, True))
+            if not _is_valid_host(ip):
+                # Reject typos up front instead of waiting on probe timeouts
+                errors["base"] = "invalid_host"
+            elif (found := await self._async_probe(ip, port)) is None:
+                errors["base"] = "cannot_connect"
             else:
-                ports_to_try.append((80, False))
-                ports_to_try.append((443, True))
-
-            session = async_get_clientsession(self.hass, verify_ssl=False)
-
-            for test_port, use_ssl in ports_to_try:
-                protocol = "https" if use_ssl else "http"
-                url = f"{protocol}://{ip}:{test_port}/Statusinfo.live.asp"
-                
-                try:
-                    LOGGER.debug("Attempting connection to %s", url)
-                    async with asyncio.timeout(5):
-                        # Just checking connectivity, 401 is success for this step (auth required)
-                        # or 200 if no auth.
-                        async with session.get(url) as response:
-                            LOGGER.debug("Connection to %s returned status %s", url, response.status)
-                            if response.status < 500:
-                                self._temp_config[CONF_ROUTER_IP] = ip
-                                self._temp_config[CONF_ROUTER_PORT] = test_port
-                                self._temp_config[CONF_USE_SSL] = use_ssl
-                                return await self.async_step_auth()
-                except Exception as err:
-                    LOGGER.debug("Connection to %s failed: %s", url, err)
-                    pass
-
-            errors["base"] = "cannot_connect"
+                test_port, use_ssl = found
+                self._temp_config[CONF_ROUTER_IP] = ip
+                self._temp_config[CONF_ROUTER_PORT] = test_port
+                self._temp_config[CONF_USE_SSL] = use_ssl
+                return await self.async_step_auth()
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_CONN_DATA_SCHEMA, errors=errors
         )
 
+    async def _async_probe(self, ip: str, port: int | None) -> tuple[int, bool] | None:
+        """Return the (port, use_ssl) the router answers on, or None."""
+        if not _is_ip_address(ip):
+            # Fail fast on DNS misses rather than on the HTTP timeout
+            try:
+                async with asyncio.timeout(2):
+                    await asyncio.get_running_loop().getaddrinfo(ip, None)
+            except (OSError, asyncio.TimeoutError) as err:
+                LOGGER.debug("Could not resolve %s: %s", ip, err)
+                return None
+
+        # Determine protocol and port if not specified. Each round is
+        # probed concurrently; later rounds are only tried as a fallback.
+        if not port:
+            probe_rounds = [[(80, False), (443, True)]]
+        elif port in HTTPS_PORTS:
+            probe_rounds = [[(port, True)], [(port, False)]]
+        elif port in HTTP_PORTS:
+            probe_rounds = [[(port, False)], [(port, True)]]
+        else:
+            probe_rounds = [[(port, False), (port, True)]]
+
+        session = self._get_session()
+
+        async def _probe(test_port: int, use_ssl: bool) -> tuple[int, int, bool]:
+            url = f"{build_base_url(ip, test_port, use_ssl)}/Statusinfo.live.asp"
+            LOGGER.debug("Attempting connection to %s", url)
+            async with asyncio.timeout(5):
+                # Just checking connectivity, 401 is success for this step (auth required)
+                # or 200 if no auth.
+                # Redirects are judged by their own status, not followed to
+                # whatever page (e.g. a captive portal) they point at
+                async with session.get(
+                    url,
+                    headers={"Connection": "keep-alive"},
+                    allow_redirects=False,
+                ) as response:
+                    LOGGER.debug("Connection to %s returned status %s", url, response.status)
+                    # Drain the body so the connection goes back to the pool
+                    await response.read()
+                    return response.status, test_port, use_ssl
+
+        for ports_to_try in probe_rounds:
+            # Probe all candidates concurrently and take the first usable answer
+            pending = {asyncio.create_task(_probe(*p)) for p in ports_to_try}
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    found = None
+                    # Collect every finished probe so no exception goes unretrieved
+                    for task in done:
+                        try:
+                            status, test_port, use_ssl = task.result()
+                        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as err:
+                            LOGGER.debug("Connection to %s failed: %s", ip, err)
+                            continue
+                        if status in _PROBE_OK_STATUSES and found is None:
+                            found = (test_port, use_ssl)
+                    if found is not None:
+                        return found
+            finally:
+                for task in pending:
+                    task.cancel()
+
+        return None
+
     async def async_step_auth(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -123,21 +213,30 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _test_credentials(self, ip, port, username, password, use_ssl):
         """Return true if credentials are valid."""
-        session = async_get_clientsession(self.hass, verify_ssl=False)
-        protocol = "https" if use_ssl else "http"
-        url = f"{protocol}://{ip}:{port}/Statusinfo.live.asp"
+        session = self._get_session()
+        url = f"{build_base_url(ip, port, use_ssl)}/Statusinfo.live.asp"
         auth = aiohttp.BasicAuth(username, password)
         
         try:
             LOGGER.debug("Testing credentials at %s", url)
-            async with session.get(url, auth=auth) as response:
-                if response.status == 200:
-                    text = await response.text()
-                    # Basic check if it looks like DD-WRT data
-                    if "{uptime::" in text or "{ipinfo::" in text:
-                         return True
-                LOGGER.debug("Credentials failed with status: %s", response.status)
-                return False
+            async with asyncio.timeout(5):
+                async with session.get(url, auth=auth) as response:
+                    if response.status == 200:
+                        # Basic check if it looks like DD-WRT data; stop reading
+                        # as soon as a marker shows up. Only the new chunk and
+                        # the previous tail are searched each time.
+                        tail = b""
+                        seen = 0
+                        async for chunk in response.content.iter_chunked(4096):
+                            window = tail + chunk
+                            if _DDWRT_SIG.search(window):
+                                return True
+                            tail = window[-_SIG_OVERLAP:]
+                            seen += len(chunk)
+                            if seen >= _SIG_SCAN_LIMIT:
+                                break
+                    LOGGER.debug("Credentials failed with status: %s", response.status)
+                    return False
         except Exception as err:
             LOGGER.debug("Credential check failed with error: %s", err)
             return False
@@ -9,12 +9,16 @@ DEFAULT_SSL = False
 DEFAULT_USERNAME = "root"
 DEFAULT_UPDATE_INTERVAL = 60
 
+# Well-known ports used to guess the scheme of a user-supplied port
+HTTP_PORTS = (80, 8080)
+HTTPS_PORTS = (443, 8443)
+
 CONF_ROUTER_IP = "router_ip"
 CONF_ROUTER_PORT = "router_port"
 CONF_USE_SSL = "use_ssl"
 CONF_TRACKER_INTERFACES = "tracker_interfaces"
 
-# Endpoints to poll in sequence
+# Endpoints polled concurrently on every update
 # Status_Router: cpu_temp, mem_info, router_time
 # Status_Internet: wan_status, ttraff_in/out
 # Status_Lan: arp_table, dhcp_leases
@@ -29,4 +33,10 @@ ENDPOINTS = [
 # Keys that identify device lists for tracking
 KEY_ACTIVE_WIRELESS = "active_wireless"
 KEY_DHCP_LEASES = "dhcp_leases"
-KEY_ARP_TABLE = "arp_table"
\ No newline at end of file
+KEY_ARP_TABLE = "arp_table"
+
+# Keys the coordinator derives from the raw data after each poll
+KEY_CONNECTED_MACS = "_connected_macs"
+KEY_DEVICES = "_devices"
+KEY_LOAD_AVGS = "_load_avgs"
+KEY_MEM = "_mem"
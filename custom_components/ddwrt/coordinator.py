@@ -3,16 +3,67 @@ from __future__ import annotations
 
 import asyncio
 from datetime import timedelta
+import hashlib
 import re
 
 import aiohttp
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, ENDPOINTS, LOGGER, DEFAULT_UPDATE_INTERVAL
+from .const import (
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    ENDPOINTS,
+    KEY_ACTIVE_WIRELESS,
+    KEY_ARP_TABLE,
+    KEY_CONNECTED_MACS,
+    KEY_DEVICES,
+    KEY_DHCP_LEASES,
+    KEY_LOAD_AVGS,
+    KEY_MEM,
+    LOGGER,
+)
 
-# Regex to find {key::value} patterns
-DDWRT_DATA_REGEX = re.compile(r"\{(\w+)::([^}]*)\}")
+# Regex to find {key::value} patterns. It runs on the raw body bytes, so
+# aiohttp never has to guess the charset of the .live.asp payload.
+DDWRT_DATA_REGEX = re.compile(rb"\{(\w+)::([^}]*)\}")
+# Regex to split 'a','b','c' list values into their quoted items
+_COMPLEX_VALUE_REGEX = re.compile(rb"'([^']*)'")
+
+# Number of fields per lease in the flat dhcp_leases list
+_DHCP_ROW_WIDTH = 7
+
+# Colon-separated MAC address, e.g. AA:BB:CC:DD:EE:FF
+_MAC_RE = re.compile(r"[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}")
+
+
+def _is_mac(item: str) -> bool:
+    """Return true if item is a colon-separated MAC address."""
+    # Cheap allocation-free gates first; the regex only confirms the hex digits
+    return (
+        len(item) == 17
+        and item.count(":") == 5
+        and _MAC_RE.fullmatch(item) is not None
+    )
+
+
+def build_base_url(host: str, port: int, use_ssl: bool) -> str:
+    """Return the router base URL for a host, port and scheme."""
+    # IPv6 literals must be bracketed or the port reads as part of the address
+    if ":" in host:
+        host = f"[{host}]"
+    return f"{'https' if use_ssl else 'http'}://{host}:{port}"
+
+
+def device_info_for(device_name: str) -> DeviceInfo:
+    """Return the router DeviceInfo shared by every platform's entities."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, device_name)},
+        name=device_name.removeprefix("ddwrt-").replace("-", " ").title(),
+        manufacturer="DD-WRT",
+        model="Router",
+    )
 
 
 class DDWRTDataUpdateCoordinator(DataUpdateCoordinator):
@@ -27,6 +78,7 @@ class DDWRTDataUpdateCoordinator(DataUpdateCoordinator):
         username: str,
         password: str,
         use_ssl: bool,
+        tracker_interfaces: list[str],
     ) -> None:
         """Initialize."""
         super().__init__(
@@ -41,58 +93,232 @@ class DDWRTDataUpdateCoordinator(DataUpdateCoordinator):
         self.username = username
         self.password = password
         self.use_ssl = use_ssl
+        self.tracker_interfaces = tracker_interfaces
         self.protocol = "https" if use_ssl else "http"
-        self.base_url = f"{self.protocol}://{self.host}:{self.port}"
+        self.base_url = build_base_url(host, port, use_ssl)
+        # Built once and reused on every poll
+        self.auth = aiohttp.BasicAuth(username, password)
+        self._endpoint_urls = tuple(
+            (endpoint, f"{self.base_url}/{endpoint}") for endpoint in ENDPOINTS
+        )
+        # Per-endpoint validators and parse results from the previous poll
+        self._etags: dict[str, str] = {}
+        self._body_hashes: dict[str, bytes] = {}
+        self._last_parsed: dict[str, dict[str, any]] = {}
 
     async def _async_update_data(self) -> dict[str, any]:
         """Fetch data from all endpoints."""
         data = {}
-        auth = aiohttp.BasicAuth(self.username, self.password)
 
-        for endpoint in ENDPOINTS:
-            url = f"{self.base_url}/{endpoint}"
+        async def _fetch(endpoint: str, url: str) -> dict[str, any]:
+            headers = {}
+            if endpoint in self._etags:
+                headers["If-None-Match"] = self._etags[endpoint]
+            async with asyncio.timeout(10):
+                async with self.session.get(
+                    url, auth=self.auth, headers=headers
+                ) as response:
+                    if response.status == 304 and endpoint in self._last_parsed:
+                        return self._last_parsed[endpoint]
+                    response.raise_for_status()
+                    raw = await response.read()
+                    etag = response.headers.get("ETag")
+
+            # Unchanged body: reuse the previous parse instead of rescanning it
+            body_hash = hashlib.blake2b(raw, digest_size=8).digest()
+            if body_hash == self._body_hashes.get(endpoint):
+                return self._last_parsed[endpoint]
+
+            # Parse the custom format
             try:
-                async with asyncio.timeout(10):
-                    async with self.session.get(url, auth=auth) as response:
-                        response.raise_for_status()
-                        text = await response.text()
-                        
-                        # Parse the custom format
-                        parsed = self._parse_ddwrt_live_format(text)
-                        data.update(parsed)
-            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-                LOGGER.warning(f"Error fetching {endpoint} from {self.host}: {err}")
-                # We continue to the next endpoint to get partial data if possible
-                continue
+                parsed = self._parse_ddwrt_live_format(raw)
             except Exception as err:
-                raise UpdateFailed(f"Unexpected error: {err}") from err
+                raise UpdateFailed(f"Unexpected error parsing {url}: {err}") from err
+
+            self._body_hashes[endpoint] = body_hash
+            self._last_parsed[endpoint] = parsed
+            if etag:
+                self._etags[endpoint] = etag
+            else:
+                self._etags.pop(endpoint, None)
+            return parsed
+
+        # Poll all endpoints at once; each is bounded by its own timeout
+        results = await asyncio.gather(
+            *(_fetch(endpoint, url) for endpoint, url in self._endpoint_urls),
+            return_exceptions=True,
+        )
+
+        for (endpoint, _), result in zip(self._endpoint_urls, results):
+            if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError, OSError)):
+                LOGGER.warning(f"Error fetching {endpoint} from {self.host}: {result}")
+                # Skip the failed endpoint and keep the others' partial data
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            data.update(result)
 
         if not data:
             raise UpdateFailed("No data received from DD-WRT router")
 
+        # Device tables are always tuples downstream, even when missing or empty
+        for key in (KEY_ACTIVE_WIRELESS, KEY_ARP_TABLE, KEY_DHCP_LEASES):
+            if not isinstance(data.get(key), tuple):
+                data[key] = ()
+
+        # Index connected MACs once so each tracker does an O(1) lookup.
+        # Non-MAC columns ride along; trackers only ever query real MACs.
+        data[KEY_CONNECTED_MACS] = frozenset(
+            (*data[KEY_ACTIVE_WIRELESS], *data[KEY_ARP_TABLE])
+        )
+        # Parse tracked devices once per poll for every consumer
+        data[KEY_DEVICES] = _get_devices_from_data(data, self.tracker_interfaces)
+        # Values shared by several sensors are derived once here too
+        data[KEY_LOAD_AVGS] = _parse_load_avgs(data.get("uptime"))
+        data[KEY_MEM] = _parse_meminfo(data.get("mem_info"))
+
         return data
 
-    def _parse_ddwrt_live_format(self, text: str) -> dict[str, any]:
+    def _parse_ddwrt_live_format(self, raw: bytes) -> dict[str, any]:
         """Parse the DD-WRT .live.asp format ({key::value})."""
+        # Two regex passes on purpose: both scans run entirely in C, while a
+        # fused single-pass tokenizer needs a Python step per quoted item.
         result = {}
-        matches = DDWRT_DATA_REGEX.findall(text)
-        
-        for key, value in matches:
-            value = value.strip()
-            # If value starts with single quote, it's a list.
+
+        # Stream matches rather than building a list of every (key, value)
+        for match in DDWRT_DATA_REGEX.finditer(raw):
+            # \w on a bytes pattern only matches ASCII, so keys decode cleanly
+            key = match.group(1).decode("ascii")
+            value = match.group(2).strip()
+            # If value starts with single quote, it's a list (kept as a tuple).
             # We preserve it as a string here (or robustly split) 
             # and let specific sensors handle precise parsing if needed (like mem_info)
             # However, for generic lists, we can try basic splitting.
-            if value.startswith("'"):
+            if value.startswith(b"'"):
                 result[key] = self._parse_complex_value(value)
             else:
-                result[key] = value
+                result[key] = value.decode("utf-8", "replace")
                 
         return result
 
-    def _parse_complex_value(self, value_str: str) -> list[str]:
-        """Parse values like 'a','b','c' into a list."""
-        parts = re.findall(r"'([^']*)'", value_str)
+    def _parse_complex_value(self, value_str: bytes) -> tuple[str, ...]:
+        """Parse values like 'a','b','c' into a tuple."""
+        # Immutable, so unchanged values compare cheaply and can be shared
+        # safely between polls
+        parts = _COMPLEX_VALUE_REGEX.findall(value_str)
         if parts:
-            return parts
-        return [value_str]
\ No newline at end of file
+            return tuple(part.decode("utf-8", "replace") for part in parts)
+        return (value_str.decode("utf-8", "replace"),)
+
+
+def _parse_load_avgs(uptime: str | None) -> tuple[float | None, ...] | None:
+    """Return the 1, 5 and 15 minute load averages from the uptime string."""
+    if not isinstance(uptime, str):
+        return None
+    _, sep, rest = uptime.partition("load average:")
+    if not sep:
+        return None
+
+    loads = []
+    # maxsplit caps the pieces even if trailing junk holds more commas
+    for item in rest.split(",", 3)[:3]:
+        try:
+            loads.append(float(item.strip()))
+        except ValueError:
+            loads.append(None)
+    loads.extend([None] * (3 - len(loads)))
+    return tuple(loads)
+
+
+def _parse_meminfo(mem_raw: str | tuple[str, ...] | None) -> tuple[int | None, int | None]:
+    """Return (MemTotal, MemFree) in kB from the mem_info value."""
+    if isinstance(mem_raw, str):
+        # 'a','b','c' splits on quotes into ['', 'a', ',', 'b', ...]
+        items = mem_raw.split("'")[1::2]
+    elif isinstance(mem_raw, tuple):
+        items = mem_raw
+    else:
+        return None, None
+
+    total = free = None
+    for i in range(len(items) - 1):
+        item = items[i]
+        if total is None and item.startswith("MemTotal"):
+            try:
+                total = int(items[i + 1].strip())
+            except ValueError:
+                pass
+        elif free is None and item.startswith("MemFree"):
+            try:
+                free = int(items[i + 1].strip())
+            except ValueError:
+                pass
+        if total is not None and free is not None:
+            break
+    return total, free
+
+
+def _get_devices_from_data(data, interfaces):
+    """Parse raw data into a dict of mac -> {name, source, ip, interface}."""
+    devices = {}
+    # None means every interface is tracked
+    allowed = frozenset(interfaces) if interfaces else None
+    
+    # 1. Wireless Active Clients
+    if raw := data.get(KEY_ACTIVE_WIRELESS, ()):
+        current_mac = None
+        current_data = []
+        
+        for item in raw:
+            if _is_mac(item):
+                if current_mac:
+                    _add_device(devices, current_mac, "wireless", current_data, allowed)
+                current_mac = item
+                current_data = []
+            else:
+                current_data.append(item)
+        
+        if current_mac:
+             _add_device(devices, current_mac, "wireless", current_data, allowed)
+
+    # 2. DHCP Leases
+    if raw := data.get(KEY_DHCP_LEASES, ()):
+        # Rows are normally name, ip, mac, expiry, id, interface, flag
+        full = len(raw) - len(raw) % _DHCP_ROW_WIDTH
+        for pos in range(0, full, _DHCP_ROW_WIDTH):
+            name, ip, mac, _expiry, _lease_id, iface, _flag = raw[pos:pos + _DHCP_ROW_WIDTH]
+            if not _is_mac(mac):
+                break
+            _add_lease(devices, mac, name, ip, iface, allowed)
+        else:
+            pos = full
+
+        # Irregular remainder: fall back to locating each MAC and its neighbours
+        for i in range(pos, len(raw)):
+            if _is_mac(raw[i]):
+                name = raw[i-2] if i >= 2 else "Unknown"
+                ip = raw[i-1] if i >= 1 else None
+                iface = raw[i+3] if i+3 < len(raw) else None
+                _add_lease(devices, raw[i], name, ip, iface, allowed)
+
+    return devices
+
+def _add_device(devices, mac, source, data_list, allowed_interfaces):
+    iface = data_list[1] if len(data_list) > 1 else None
+    
+    if allowed_interfaces is not None and iface and iface not in allowed_interfaces:
+        return
+
+    devices[mac] = {
+        "name": f"Device {mac}",
+        "source": source,
+        "interface": iface
+    }
+
+
+def _add_lease(devices, mac, name, ip, iface, allowed_interfaces):
+    if allowed_interfaces is not None and iface not in allowed_interfaces:
+        return
+
+    if mac not in devices:
+        devices[mac] = {"name": name, "source": "dhcp", "ip": ip, "interface": iface}
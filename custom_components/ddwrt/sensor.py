@@ -1,8 +1,11 @@
 """Sensor platform for DD-WRT."""
 from __future__ import annotations
 
+import functools
 import re
-from datetime import datetime
+import sys
+import time
+from typing import Any, Callable
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -12,15 +15,22 @@ from homeassistant.components.sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfDataRate, UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import DDWRTDataUpdateCoordinator
+from .const import (
+    DOMAIN,
+    KEY_CONNECTED_MACS,
+    KEY_DEVICES,
+    KEY_LOAD_AVGS,
+    KEY_MEM,
+)
+from .coordinator import DDWRTDataUpdateCoordinator, device_info_for
 
 # Keys to ignore (handled by other platforms or too complex)
-IGNORED_KEYS = {
+IGNORED_KEYS: frozenset[str] = frozenset({
     "wan_status", # Binary Sensor
     "wl_radio",   # Binary Sensor
     "active_wireless", # Device Tracker
@@ -32,28 +42,44 @@ IGNORED_KEYS = {
     "active_wds",      # Usually empty/complex
     "pppoe_ac_name",   # Ignored per user request
     "ipinfo",          # Redundant with wan_ipaddr
+    KEY_CONNECTED_MACS,  # Derived index for the device tracker
+    KEY_DEVICES,         # Derived index for the device tracker
+    KEY_LOAD_AVGS,       # Derived from uptime
+    KEY_MEM,             # Derived from mem_info
+})
+
+# Sensors computed from the previous poll, so they exist even without a value
+_RATE_KEYS = frozenset({"wan_in_rate", "wan_out_rate"})
+
+# Placeholders the router reports instead of a real value
+_SENTINEL_VALUES = frozenset({"n.a", "n.a.", "nan", "unknown"})
+
+# Leading number of a temperature reading such as "45.5 &deg;C"
+_TEMP_NUM_RE = re.compile(r"([\d.]+)")
+
+# Acronyms and abbreviations to fix up after title-casing a key
+_NAME_FIXES = {
+    "Wl": "Wireless",
+    "Pppoe": "PPPoE",
+    "Dhcp": "DHCP",
+    "Ip": "IP",
+    "Lan": "LAN",
+    "Mac": "MAC",
+    "Wan": "WAN",
+    "Ssid": "SSID",
+    "Gps": "GPS",
+    "Ntp": "NTP",
+    "Dns": "DNS",
 }
+_NAME_FIX_RE = re.compile("|".join(_NAME_FIXES))
+
 
+@functools.lru_cache(maxsize=256)
 def format_name(key: str) -> str:
     """Format a key into a friendly name with correct capitalization."""
     name = key.replace("_", " ").title()
-    replacements = {
-        "Wl ": "Wireless ",
-        "Wl": "Wireless",
-        "Pppoe": "PPPoE",
-        "Dhcp": "DHCP",
-        "Ip": "IP",
-        "Lan": "LAN",
-        "Mac": "MAC",
-        "Wan": "WAN",
-        "Ssid": "SSID",
-        "Gps": "GPS",
-        "Ntp": "NTP",
-        "Dns": "DNS",
-    }
-    for old, new in replacements.items():
-        name = name.replace(old, new)
-    return name.strip()
+    # One pass for all fixes; keys repeat across reloads, hence the cache
+    return _NAME_FIX_RE.sub(lambda m: _NAME_FIXES[m.group()], name).strip()
 
 SENSOR_TYPES: dict[str, SensorEntityDescription] = {
     "wan_ipaddr": SensorEntityDescription(
@@ -180,6 +206,11 @@ SENSOR_TYPES: dict[str, SensorEntityDescription] = {
     ),
 }
 
+# SENSOR_TYPES never changes, so setup iterates a prebuilt tuple of its items
+_SENSOR_TYPES_ITEMS: tuple[tuple[str, SensorEntityDescription], ...] = tuple(
+    SENSOR_TYPES.items()
+)
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -188,25 +219,30 @@ async def async_setup_entry(
     """Set up DD-WRT sensors."""
     coordinator: DDWRTDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
     device_name = f"ddwrt-{entry.data['name']}"
+    device_info = device_info_for(device_name)
     
     entities = []
     created_keys = set()
     
     # 1. Standard mapped keys
-    for key, desc in SENSOR_TYPES.items():
-        entity = DDWRTSensor(coordinator, device_name, desc)
+    for key, desc in _SENSOR_TYPES_ITEMS:
+        entity = DDWRTSensor(coordinator, device_name, device_info, desc)
         # Check availability immediately, but allow rates/derived to exist
-        if key not in ["wan_in_rate", "wan_out_rate"] and (entity.native_value is None or entity.native_value == ""):
-             entity._attr_entity_registry_enabled_default = False
+        if key not in _RATE_KEYS:
+            value = entity.native_value
+            if value is None or value == "":
+                entity._attr_entity_registry_enabled_default = False
         entities.append(entity)
         created_keys.add(key)
 
     # 2. Dynamic Scan
+    # One hash lookup per key; parsed values are only ever str or tuple
+    skip = IGNORED_KEYS | created_keys
     for key, value in coordinator.data.items():
-        if key in created_keys or key in IGNORED_KEYS:
-            continue
-        if isinstance(value, (list, dict)):
+        if key in skip or type(value) in (list, tuple, dict):
             continue
+        # Interned once here; the description keeps it for the entity's life
+        key = sys.intern(key)
             
         friendly_name = format_name(key)
         desc = SensorEntityDescription(
@@ -215,11 +251,11 @@ async def async_setup_entry(
             icon="mdi:information-outline",
             entity_category=EntityCategory.DIAGNOSTIC,
         )
-        entity = DDWRTSensor(coordinator, device_name, desc)
-        if entity.native_value is None or entity.native_value == "":
+        entity = DDWRTSensor(coordinator, device_name, device_info, desc)
+        value = entity.native_value
+        if value is None or value == "":
             entity._attr_entity_registry_enabled_default = False
         entities.append(entity)
-        created_keys.add(key)
 
     async_add_entities(entities)
 
@@ -231,6 +267,7 @@ class DDWRTSensor(CoordinatorEntity, SensorEntity):
         self,
         coordinator: DDWRTDataUpdateCoordinator,
         device_name: str,
+        device_info: DeviceInfo,
         description: SensorEntityDescription,
     ) -> None:
         """Initialize."""
@@ -240,136 +277,180 @@ class DDWRTSensor(CoordinatorEntity, SensorEntity):
         self._attr_unique_id = f"{device_name}_{description.key}"
         self._attr_has_entity_name = True
         self._attr_entity_registry_enabled_default = True
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_name)},
-            "name": entry_name_from_device_name(device_name),
-            "manufacturer": "DD-WRT",
-            "model": "Router",
-        }
+        self._attr_device_info = device_info
         # For rate calculation
         self._last_value = None
         self._last_time = None
+        self._rate = None
+        if description.key in _RATE_KEYS:
+            # Take the baseline from the data the entity is created with
+            self._update_rate()
+        self._attr_native_value = self._compute_value()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Rates depend on the time between polls, so they must advance once
+        # per update rather than on every state read. A failed refresh
+        # re-sends the old data, so keep the baseline until a real poll.
+        if (
+            self.entity_description.key in _RATE_KEYS
+            and self.coordinator.last_update_success
+        ):
+            self._update_rate()
+        # Computed once here so state reads are plain attribute lookups
+        self._attr_native_value = self._compute_value()
+        super()._handle_coordinator_update()
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        data = self.coordinator.data
+    def _update_rate(self) -> None:
+        """Compute the transfer rate since the previous poll."""
         key = self.entity_description.key
-        
-        # 1. Load Averages
-        if key in ["load_avg_1min", "load_avg_5min", "load_avg_15min"]:
-            if "uptime" in data:
-                try:
-                    parts = data["uptime"].split("load average:")
-                    if len(parts) > 1:
-                        loads = parts[1].split(",")
-                        if key == "load_avg_1min": return float(loads[0].strip())
-                        if key == "load_avg_5min": return float(loads[1].strip())
-                        if key == "load_avg_15min": return float(loads[2].strip())
-                except (ValueError, IndexError):
-                    pass
-            return None
+        source_key = "ttraff_in" if key == "wan_in_rate" else "ttraff_out"
+        new_val = self.coordinator.data.get(source_key)
+        now = time.monotonic()
 
-        # 2. Bandwidth Rates (Calculated)
-        if key in ["wan_in_rate", "wan_out_rate"]:
-            source_key = "ttraff_in" if key == "wan_in_rate" else "ttraff_out"
-            new_val = data.get(source_key)
-            now = datetime.now()
-            
-            if new_val is None:
-                return None
-                
-            try:
-                new_val = float(new_val) # MB total
-            except ValueError:
-                return None
-
-            # If this is the first update, just store state and return 0
-            if self._last_value is None or self._last_time is None:
-                self._last_value = new_val
-                self._last_time = now
-                return 0.0
-
-            # Calculate rate
-            time_delta = (now - self._last_time).total_seconds()
-            if time_delta == 0:
-                return 0.0
-                
-            diff = new_val - self._last_value
-            
-            # Reset detection (if router rebooted and counter is lower)
-            if diff < 0:
-                self._last_value = new_val
-                self._last_time = now
-                return 0.0
-
-            # Convert MB to kB (1 MB = 1024 kB)
-            diff_kb = diff * 1024
-            rate_kbps = diff_kb / time_delta
-            
-            # Update history
+        if new_val is None:
+            self._rate = None
+            return
+
+        try:
+            new_val = float(new_val) # MB total
+        except ValueError:
+            self._rate = None
+            return
+
+        # If this is the first update, just store state and report 0
+        if self._last_value is None or self._last_time is None:
             self._last_value = new_val
             self._last_time = now
-            
-            return round(rate_kbps, 1)
+            self._rate = 0.0
+            return
 
-        # 3. Memory
-        if key in ["mem_total_kb", "mem_free_kb", "mem_used_percent"]:
-            mem_raw = data.get("mem_info")
-            if not mem_raw: return None
-            
-            if isinstance(mem_raw, str):
-                lst = re.findall(r"'([^']*)'", mem_raw)
-            elif isinstance(mem_raw, list):
-                lst = mem_raw
-            else: return None
-
-            def get_mem_value(label_start):
-                for i, item in enumerate(lst):
-                    if item.startswith(label_start):
-                        if i + 1 < len(lst):
-                            try: return int(lst[i + 1].strip())
-                            except ValueError: pass
-                return None
-
-            total = get_mem_value("MemTotal")
-            free = get_mem_value("MemFree")
-            
-            if key == "mem_total_kb": return total
-            if key == "mem_free_kb": return free
-            if key == "mem_used_percent":
-                if total and free is not None and total > 0:
-                    used = total - free
-                    return round((used / total) * 100, 1)
-                return None
-
-        # 4. General Strings
-        val = data.get(key)
-        if isinstance(val, str):
-            val = val.replace("&nbsp;", " ").strip()
-            if val.lower() in ["n.a", "n.a.", "nan", "unknown"]:
-                return None
-
-        if key == "uptime" and val:
-            if " up " in val:
-                try:
-                    val = val.split(" up ")[1]
-                    return val.split(",")[0].strip()
-                except IndexError: pass
-            return val
-
-        if key == "wan_uptime" and val:
+        # Calculate rate
+        time_delta = now - self._last_time
+        if time_delta == 0:
+            self._rate = 0.0
+            return
+
+        diff = new_val - self._last_value
+
+        # Reset detection (if router rebooted and counter is lower)
+        if diff < 0:
+            self._last_value = new_val
+            self._last_time = now
+            self._rate = 0.0
+            return
+
+        # Convert MB to kB (1 MB = 1024 kB)
+        diff_kb = diff * 1024
+        rate_kbps = diff_kb / time_delta
+
+        # Update history
+        self._last_value = new_val
+        self._last_time = now
+
+        self._rate = round(rate_kbps, 1)
+
+    def _compute_value(self):
+        """Return the state of the sensor for the current data."""
+        key = self.entity_description.key
+        handler = _HANDLERS.get(key)
+        if handler is not None:
+            return handler(self, self.coordinator.data)
+        return _string_value(self.coordinator.data, key)
+
+
+# Value handlers for keys that are derived rather than read directly
+
+def _load_avg(sensor: DDWRTSensor, data: dict, index: int):
+    """Return one load average parsed by the coordinator."""
+    loads = data.get(KEY_LOAD_AVGS)
+    return loads[index] if loads else None
+
+
+def _rate(sensor: DDWRTSensor, data: dict):
+    """Return the rate computed on the last coordinator update."""
+    return sensor._rate
+
+
+def _mem_total(sensor: DDWRTSensor, data: dict):
+    """Return total memory in kB."""
+    return data.get(KEY_MEM, (None, None))[0]
+
+
+def _mem_free(sensor: DDWRTSensor, data: dict):
+    """Return free memory in kB."""
+    return data.get(KEY_MEM, (None, None))[1]
+
+
+def _mem_used_percent(sensor: DDWRTSensor, data: dict):
+    """Return used memory as a percentage of the total."""
+    total, free = data.get(KEY_MEM, (None, None))
+    if total and free is not None and total > 0:
+        used = total - free
+        return round((used / total) * 100, 1)
+    return None
+
+
+_HANDLERS: dict[str, Callable[[DDWRTSensor, dict], Any]] = {
+    "load_avg_1min": functools.partial(_load_avg, index=0),
+    "load_avg_5min": functools.partial(_load_avg, index=1),
+    "load_avg_15min": functools.partial(_load_avg, index=2),
+    "wan_in_rate": _rate,
+    "wan_out_rate": _rate,
+    "mem_total_kb": _mem_total,
+    "mem_free_kb": _mem_free,
+    "mem_used_percent": _mem_used_percent,
+}
+
+
+# Formatters for router strings that need trimming down for display
+
+def _format_uptime(val: str) -> str:
+    if " up " in val:
+        try:
+            val = val.split(" up ")[1]
             return val.split(",")[0].strip()
+        except IndexError: pass
+    return val
+
+
+def _format_wan_uptime(val: str) -> str:
+    return val.split(",")[0].strip()
+
 
-        if key == "wan_ipaddr" and val:
-             return val.split("/")[0]
+def _format_wan_ipaddr(val: str) -> str:
+    return val.split("/")[0]
 
-        if key.startswith("cpu_temp") and val:
-             match = re.search(r"([\d\.]+)", val)
-             if match: return match.group(1)
-             return None
 
+def _format_cpu_temp(val: str) -> str | None:
+    match = _TEMP_NUM_RE.search(val)
+    if match: return match.group(1)
+    return None
+
+
+_FORMATTERS: dict[str, Callable[[str], Any]] = {
+    "uptime": _format_uptime,
+    "wan_uptime": _format_wan_uptime,
+    "wan_ipaddr": _format_wan_ipaddr,
+}
+
+
+def _string_value(data: dict, key: str):
+    """Return a value read straight from the router, cleaned up for display."""
+    val = data.get(key)
+    if isinstance(val, str):
+        # The &nbsp; HTML entity is usually absent, so skip replace() then
+        if "&nbsp;" in val:
+            val = val.replace("&nbsp;", " ")
+        val = val.strip()
+        if val and val.lower() in _SENTINEL_VALUES:
+            return None
+
+    if not val:
         return val
 
-def entry_name_from_device_name(dev_name):
-    return dev_name.replace("ddwrt-", "").replace("-", " ").title()
\ No newline at end of file
+    formatter = _FORMATTERS.get(key)
+    if formatter is None and key.startswith("cpu_temp"):
+        formatter = _format_cpu_temp
+    return formatter(val) if formatter else val